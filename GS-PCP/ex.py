@@ -14,12 +14,44 @@ Como usar:
 
 """
 
+from __future__ import annotations
+
 import json
 import os
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Iterator, Tuple, Optional
 from datetime import datetime
 
+# modulos pesados importados sob demanda: a CLI sobe sem pagar o custo de
+# importar numpy/orjson/numba ate o primeiro uso real
+_np = None
+_orjson_checked = False
+_orjson = None
+
+
+def _get_np():
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+def _get_orjson():
+    """orjson (encoder/decoder em C) quando instalado, senao None."""
+    global _orjson_checked, _orjson
+    if not _orjson_checked:
+        _orjson_checked = True
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            pass
+    return _orjson
+
 PROFILES_DIR = "profiles"
 if not os.path.exists(PROFILES_DIR):
     os.makedirs(PROFILES_DIR)
@@ -27,57 +59,141 @@ if not os.path.exists(PROFILES_DIR):
 
 @dataclass
 class Competencia:
+    # __slots__ manual (em vez de slots=True) para abrigar tambem o cache
+    # _nome_lower, que nao e um campo do dataclass
+    __slots__ = ("nome", "categoria", "nivel", "_nome_lower")
+
     nome: str
     categoria: str  # 'técnica' ou 'comportamental'
     nivel: float     # 0.0 - 10.0
 
+    def __post_init__(self):
+        # nome normalizado cacheado e interned: evita realocar strings com
+        # .lower() a cada comparacao e compartilha o objeto com o vocabulario
+        # de requisitos, deixando os lookups no fast path de ponteiro
+        self._nome_lower = sys.intern(self.nome.lower())
+
     def as_dict(self) -> dict:
         return asdict(self)
 
     @staticmethod
     def from_dict(d: dict) -> "Competencia":
-        return Competencia(nome=d["nome"], categoria=d["categoria"], nivel=d["nivel"])
+        # sys.intern: nomes e categorias se repetem muito entre perfis;
+        # compartilhar os objetos str economiza memoria e acelera os lookups
+        return Competencia(
+            nome=sys.intern(d["nome"]),
+            categoria=sys.intern(d["categoria"]),
+            nivel=d["nivel"],
+        )
+
+
+class _CompetenciasView:
+    """Visao somente-leitura das colunas de um Perfil como objetos Competencia."""
+
+    __slots__ = ("_perfil",)
+
+    def __init__(self, perfil: "Perfil"):
+        self._perfil = perfil
+
+    def __len__(self) -> int:
+        return len(self._perfil._names)
+
+    def __getitem__(self, i: int) -> Competencia:
+        p = self._perfil
+        return Competencia(nome=p._names[i], categoria=p._cats[i], nivel=float(p._niveis[i]))
+
+    def __iter__(self) -> Iterator[Competencia]:
+        return (self[i] for i in range(len(self)))
 
 
 class Perfil:
-    """Representa um perfil profissional com um conjunto de competências."""
+    """Representa um perfil profissional com um conjunto de competências.
+
+    Internamente as competencias ficam em colunas paralelas (nomes,
+    categorias e niveis em np.ndarray) para permitir operacoes vetorizadas;
+    `competencias` expoe a visao tradicional de objetos Competencia.
+    """
+
+    __slots__ = (
+        "nome", "idade", "descricao", "_names", "_cats", "_niveis", "_index",
+        "_cat_sum", "_cat_cnt", "_versao", "criado_em", "__weakref__",
+    )
 
     def __init__(self, nome: str, idade: Optional[int] = None, descricao: str = ""):
         self.nome = nome
         self.idade = idade
         self.descricao = descricao
-        self.competencias: List[Competencia] = []
+        np = _get_np()
+        # colunas paralelas (SoA): nomes, categorias e niveis
+        self._names: List[str] = []
+        self._cats: List[str] = []
+        self._niveis: "np.ndarray" = np.empty(0, dtype=np.float64)
+        # indice: nome em minusculas -> posicao nas colunas (lookup O(1))
+        self._index: Dict[str, int] = {}
+        # agregados incrementais por categoria (media O(1) em vez de O(C))
+        self._cat_sum: Dict[str, float] = {}
+        self._cat_cnt: Dict[str, int] = {}
+        # versao das competencias: invalida caches externos (ex.: vetores de
+        # niveis guardados pelo Recomendador) a cada mutacao
+        self._versao = 0
         self.criado_em = datetime.now().isoformat()
 
+    @property
+    def competencias(self) -> _CompetenciasView:
+        return _CompetenciasView(self)
+
+    def _cat_add(self, categoria: str, nivel: float) -> None:
+        self._cat_sum[categoria] = self._cat_sum.get(categoria, 0.0) + nivel
+        self._cat_cnt[categoria] = self._cat_cnt.get(categoria, 0) + 1
+
+    def _cat_sub(self, categoria: str, nivel: float) -> None:
+        restante = self._cat_cnt[categoria] - 1
+        if restante == 0:
+            del self._cat_sum[categoria]
+            del self._cat_cnt[categoria]
+        else:
+            self._cat_sum[categoria] -= nivel
+            self._cat_cnt[categoria] = restante
+
     def adicionar_competencia(self, comp: Competencia) -> None:
+        self._versao += 1
         # substitui se existir mesma competencia (mesmo nome)
-        for i, c in enumerate(self.competencias):
-            if c.nome.lower() == comp.nome.lower():
-                self.competencias[i] = comp
-                return
-        self.competencias.append(comp)
+        key = comp._nome_lower
+        i = self._index.get(key)
+        if i is not None:
+            self._cat_sub(self._cats[i], float(self._niveis[i]))
+            self._cat_add(comp.categoria, comp.nivel)
+            self._names[i] = comp.nome
+            self._cats[i] = comp.categoria
+            self._niveis[i] = comp.nivel
+            return
+        self._index[key] = len(self._names)
+        self._names.append(comp.nome)
+        self._cats.append(comp.categoria)
+        self._niveis = _get_np().append(self._niveis, float(comp.nivel))
+        self._cat_add(comp.categoria, comp.nivel)
 
     def remover_competencia(self, nome: str) -> bool:
-        nome = nome.lower()
-        for i, c in enumerate(self.competencias):
-            if c.nome.lower() == nome:
-                del self.competencias[i]
-                return True
-        return False
+        i = self._index.pop(nome.lower(), None)
+        if i is None:
+            return False
+        self._versao += 1
+        self._cat_sub(self._cats[i], float(self._niveis[i]))
+        del self._names[i]
+        del self._cats[i]
+        self._niveis = _get_np().delete(self._niveis, i)
+        # posicoes apos a removida deslocam uma casa para tras
+        for key, pos in self._index.items():
+            if pos > i:
+                self._index[key] = pos - 1
+        return True
 
     def obter_nivel(self, nome: str) -> Optional[float]:
-        for c in self.competencias:
-            if c.nome.lower() == nome.lower():
-                return c.nivel
-        return None
+        i = self._index.get(nome.lower())
+        return float(self._niveis[i]) if i is not None else None
 
     def medias_por_categoria(self) -> Dict[str, float]:
-        soma: Dict[str, float] = {}
-        cont: Dict[str, int] = {}
-        for c in self.competencias:
-            soma[c.categoria] = soma.get(c.categoria, 0.0) + c.nivel
-            cont[c.categoria] = cont.get(c.categoria, 0) + 1
-        return {cat: (soma[cat] / cont[cat]) for cat in soma}
+        return {cat: self._cat_sum[cat] / cnt for cat, cnt in self._cat_cnt.items()}
 
     def to_dict(self) -> dict:
         return {
@@ -91,24 +207,53 @@ class Perfil:
     @staticmethod
     def from_dict(d: dict) -> "Perfil":
         p = Perfil(nome=d["nome"], idade=d.get("idade"), descricao=d.get("descricao", ""))
-        p.competencias = [Competencia.from_dict(cd) for cd in d.get("competencias", [])]
-        p.criado_em = d.get("criado_em", datetime.now().isoformat())
+        comps = d.get("competencias", [])
+        p._names = [sys.intern(cd["nome"]) for cd in comps]
+        p._cats = [sys.intern(cd["categoria"]) for cd in comps]
+        np = _get_np()
+        p._niveis = np.array([cd["nivel"] for cd in comps], dtype=np.float64)
+        p._index = {sys.intern(nome.lower()): i for i, nome in enumerate(p._names)}
+        for cat, nivel in zip(p._cats, p._niveis):
+            p._cat_add(cat, float(nivel))
+        # dict.get avaliaria datetime.now() mesmo quando a chave existe
+        if "criado_em" in d:
+            p.criado_em = d["criado_em"]
         return p
 
     def salvar(self, filename: Optional[str] = None) -> str:
         if filename is None:
             safe_name = "_".join(self.nome.split()).lower()
             filename = os.path.join(PROFILES_DIR, f"{safe_name}.json")
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        orjson = _get_orjson()
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
         return filename
 
     @staticmethod
     def carregar(filename: str) -> "Perfil":
-        with open(filename, "r", encoding="utf-8") as f:
-            d = json.load(f)
+        with open(filename, "rb") as f:
+            dados = f.read()
+        orjson = _get_orjson()
+        d = orjson.loads(dados) if orjson is not None else json.loads(dados)
         return Perfil.from_dict(d)
 
+    @staticmethod
+    def carregar_todos(dir_path: str = PROFILES_DIR) -> List["Perfil"]:
+        """Carrega todos os perfis .json do diretorio, com leituras em paralelo.
+
+        Util para fluxos em lote (ex.: pontuar um catalogo inteiro de perfis
+        com recomendar_batch) sem pagar o I/O de arquivo serializado.
+        """
+        paths = [e.path for e in os.scandir(dir_path) if e.name.endswith(".json")]
+        if not paths:
+            return []
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(Perfil.carregar, paths))
+
 
 class Carreira:
     """Modelo simples de carreira com requisitos (competencia -> (peso, nivel_desejado))."""
@@ -116,75 +261,261 @@ class Carreira:
     def __init__(self, nome: str, requisitos: Dict[str, Tuple[float, float]], descricao: str = ""):
         self.nome = nome
         # requisitos: { 'Python': (peso, nivel_desejado)}
-        self.requisitos = {k: (float(v[0]), float(v[1])) for k, v in requisitos.items()}
+        self.requisitos = {sys.intern(k): (float(v[0]), float(v[1])) for k, v in requisitos.items()}
         self.descricao = descricao
+        # colunas pre-computadas dos requisitos, para o caminho quente de
+        # pontuacao (evita iterar o dict e refazer .lower()/float() a cada uso)
+        np = _get_np()
+        self._req_names: Tuple[str, ...] = tuple(self.requisitos)
+        self._req_names_lower: Tuple[str, ...] = tuple(sys.intern(k.lower()) for k in self.requisitos)
+        self._pesos: "np.ndarray" = np.array([v[0] for v in self.requisitos.values()])
+        self._desejados: "np.ndarray" = np.array([v[1] for v in self.requisitos.values()])
 
     def to_dict(self) -> dict:
         return {"nome": self.nome, "requisitos": self.requisitos, "descricao": self.descricao}
 
 
+def _score_kernel(U, have, D, W, mask) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Nucleo vetorizado de pontuacao, sem branches Python.
+
+    U/have (niveis do perfil e mascara de presenca) devem ser
+    broadcast-compativeis com as matrizes D/W/mask [carreiras x requisitos].
+    Retorna (scores 0-100, matriz de gaps por requisito).
+    """
+    np = _get_np()
+    # contribuicao: U/D limitado a [0,1]; 1.0 quando D == 0; 0 onde o perfil
+    # nao possui a competencia. divide com where= evita divisao por zero.
+    contrib = np.ones(np.broadcast_shapes(U.shape, D.shape))
+    np.divide(U, D, out=contrib, where=D > 0)
+    np.clip(contrib, 0.0, 1.0, out=contrib)
+    contrib *= have
+    gap_matrix = np.maximum(0.0, D - U) * mask
+
+    pesos = W * mask
+    peso_total = pesos.sum(axis=-1)
+    score_total = (contrib * pesos).sum(axis=-1)
+    scores = np.divide(score_total, peso_total, out=np.zeros_like(score_total), where=peso_total > 0)
+    scores *= 100.0
+    return scores, gap_matrix
+
+
+_score_numba = None
+_numba_checked = False
+
+
+def _get_score_numba():
+    """Compila (uma vez, sob demanda) a versao numba de _score_kernel.
+
+    Funde as passadas NumPy em um unico loop sem temporarios, paralelizado
+    sobre as carreiras. Retorna None quando numba nao esta instalado.
+    """
+    global _score_numba, _numba_checked
+    if _numba_checked:
+        return _score_numba
+    _numba_checked = True
+    try:
+        import numba
+    except ImportError:
+        return None
+    np = _get_np()
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def kernel(U, have, D, W, mask):
+        n_car, n_req = D.shape
+        scores = np.zeros(n_car)
+        gap_matrix = np.zeros((n_car, n_req))
+        for i in numba.prange(n_car):
+            score_total = 0.0
+            peso_total = 0.0
+            for j in range(n_req):
+                if mask[i, j]:
+                    d = D[i, j]
+                    contrib = 0.0
+                    if have[j]:
+                        if d > 0:
+                            contrib = min(U[j] / d, 1.0)
+                        else:
+                            contrib = 1.0
+                    score_total += contrib * W[i, j]
+                    peso_total += W[i, j]
+                    gap = d - U[j]
+                    if gap > 0:
+                        gap_matrix[i, j] = gap
+            if peso_total > 0:
+                scores[i] = score_total / peso_total * 100.0
+        return scores, gap_matrix
+
+    _score_numba = kernel
+    return _score_numba
+
+
 class Recomendador:
     """L\u00f3gica de recomendacao: pontua carreiras segundo o alinhamento do perfil com os requisitos."""
 
     def __init__(self, carreiras: Optional[List[Carreira]] = None):
         self.carreiras = carreiras if carreiras is not None else []
+        # cache perfil -> (versao, U, have); weak para nao prender perfis vivos
+        self._vetores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._rebuild_matrix()
 
     def adicionar_carreira(self, carreira: Carreira) -> None:
         self.carreiras.append(carreira)
+        self._rebuild_matrix()
+
+    def _rebuild_matrix(self) -> None:
+        """(Re)materializa as matrizes densas de requisitos [carreiras x vocabulario].
+
+        Cada coluna corresponde a um nome de requisito (em minusculas) do
+        vocabulario compartilhado; W guarda pesos, D niveis desejados e
+        mask indica quais requisitos cada carreira possui.
+        """
+        np = _get_np()
+        vocab: Dict[str, int] = {}
+        for carreira in self.carreiras:
+            for req_nome in carreira._req_names_lower:
+                vocab.setdefault(req_nome, len(vocab))
+        self._req_vocab = vocab
+        n_car, n_req = len(self.carreiras), len(vocab)
+        self._W = np.zeros((n_car, n_req))
+        self._D = np.zeros((n_car, n_req))
+        self._mask = np.zeros((n_car, n_req), dtype=bool)
+        for i, carreira in enumerate(self.carreiras):
+            cols = [vocab[req_nome] for req_nome in carreira._req_names_lower]
+            self._W[i, cols] = carreira._pesos
+            self._D[i, cols] = carreira._desejados
+            self._mask[i, cols] = True
+        # vetores cacheados estao alinhados ao vocabulario antigo
+        self._vetores.clear()
+
+    def _vetor_niveis(self, perfil: Perfil) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Niveis do perfil alinhados ao vocabulario (0 onde ausente) + mascara.
+
+        O resultado fica cacheado por perfil e so e reconstruido quando o
+        perfil muda (ver Perfil._versao) ou o vocabulario e refeito; chamadas
+        repetidas (recomendar + gerar_trilha, lotes) reutilizam o vetor.
+        """
+        entrada = self._vetores.get(perfil)
+        if entrada is not None and entrada[0] == perfil._versao:
+            return entrada[1], entrada[2]
+        np = _get_np()
+        U = np.zeros(len(self._req_vocab))
+        have = np.zeros(len(self._req_vocab), dtype=bool)
+        for req_nome, j in self._req_vocab.items():
+            i = perfil._index.get(req_nome)
+            if i is not None:
+                U[j] = perfil._niveis[i]
+                have[j] = True
+        self._vetores[perfil] = (perfil._versao, U, have)
+        return U, have
 
     def recomendar(self, perfil: Perfil, top_n: int = 5) -> List[Dict]:
+        if not self.carreiras:
+            return []
+        np = _get_np()
+        U, have = self._vetor_niveis(perfil)
+        kernel_numba = _get_score_numba()
+        if kernel_numba is not None:
+            scores, gap_matrix = kernel_numba(U, have, self._D, self._W, self._mask)
+        else:
+            scores, gap_matrix = _score_kernel(U, have, self._D, self._W, self._mask)
+
+        # top-N sem ordenar o catalogo inteiro
+        top_n = min(top_n, len(scores))
+        idx = np.argpartition(-scores, top_n - 1)[:top_n]
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+
         resultados = []
-        for carreira in self.carreiras:
-            score_total = 0.0
-            peso_total = 0.0
+        for i in idx:
+            carreira = self.carreiras[i]
             gaps: Dict[str, float] = {}
-
-            for req_nome, (peso, nivel_desejado) in carreira.requisitos.items():
-                nivel_usuario = perfil.obter_nivel(req_nome)
-                peso_total += peso
-                if nivel_usuario is None:
-                    # falta totalmente -> gap = nivel_desejado
-                    gap = nivel_desejado
-                    contrib = 0.0
-                else:
-                    gap = max(0.0, nivel_desejado - nivel_usuario)
-                    # se usuario excede nivel desejado, contibuicao maxima
-                    contrib = max(0.0, (nivel_usuario / nivel_desejado)) if nivel_desejado > 0 else 1.0
-                    if contrib > 1.0:
-                        contrib = 1.0
-                # soma ponderada
-                score_total += contrib * peso
+            for req_nome, req_lower in zip(carreira._req_names, carreira._req_names_lower):
+                gap = gap_matrix[i, self._req_vocab[req_lower]]
                 if gap > 0:
-                    gaps[req_nome] = gap
-
-            # normaliza score para 0-100
-            normalized = (score_total / peso_total * 100.0) if peso_total > 0 else 0.0
+                    gaps[req_nome] = float(gap)
             resultados.append({
                 "carreira": carreira,
-                "score": round(normalized, 2),
+                "score": round(float(scores[i]), 2),
                 "gaps": gaps,
             })
-
-        # ordena por score desc
-        resultados.sort(key=lambda x: x["score"], reverse=True)
-        return resultados[:top_n]
+        return resultados
+
+    def recomendar_batch(self, perfis: List[Perfil], top_n: int = 5) -> List[List[Dict]]:
+        """Pontua varios perfis de uma vez; retorna as recomendacoes de cada um.
+
+        Equivalente a chamar recomendar() por perfil, mas o calculo inteiro
+        acontece em um unico broadcast [perfis x carreiras x requisitos],
+        amortizando o overhead do interpretador sobre o lote.
+        """
+        if not self.carreiras or not perfis:
+            return [[] for _ in perfis]
+        np = _get_np()
+        n_req = len(self._req_vocab)
+        Umat = np.zeros((len(perfis), n_req))
+        have = np.zeros((len(perfis), n_req), dtype=bool)
+        for p_i, perfil in enumerate(perfis):
+            Umat[p_i], have[p_i] = self._vetor_niveis(perfil)
+
+        scores, gap_tensor = _score_kernel(
+            Umat[:, None, :], have[:, None, :], self._D, self._W, self._mask
+        )
+
+        top_n = min(top_n, scores.shape[1])
+        idx = np.argpartition(-scores, top_n - 1, axis=1)[:, :top_n]
+
+        resultados_por_perfil: List[List[Dict]] = []
+        for p_i, perfil in enumerate(perfis):
+            ordem = idx[p_i][np.argsort(-scores[p_i, idx[p_i]], kind="stable")]
+            resultados = []
+            for i in ordem:
+                carreira = self.carreiras[i]
+                gap_row = gap_tensor[p_i, i]
+                gaps: Dict[str, float] = {}
+                for req_nome, req_lower in zip(carreira._req_names, carreira._req_names_lower):
+                    gap = gap_row[self._req_vocab[req_lower]]
+                    if gap > 0:
+                        gaps[req_nome] = float(gap)
+                resultados.append({
+                    "carreira": carreira,
+                    "score": round(float(scores[p_i, i]), 2),
+                    "gaps": gaps,
+                })
+            resultados_por_perfil.append(resultados)
+        return resultados_por_perfil
 
     def gerar_trilha(self, perfil: Perfil, carreira: Carreira, top_k: int = 5) -> List[str]:
         """Gera recomenda\u00e7\u00f5es de aprendizagem a partir dos maiores gaps."""
-        # calcula gaps
-        gaps: List[Tuple[str, float, float]] = []  # nome, gap, nivel_desejado
-        for req_nome, (peso, nivel_desejado) in carreira.requisitos.items():
-            nivel_usuario = perfil.obter_nivel(req_nome) or 0.0
-            gap = max(0.0, nivel_desejado - nivel_usuario)
-            if gap > 0:
-                gaps.append((req_nome, gap, nivel_desejado))
-        # ordena por gap desc
-        gaps.sort(key=lambda x: x[1], reverse=True)
-
-        # transforma em recomendações práticas (strings)
+        np = _get_np()
+        # calcula gaps vetorizado sobre as colunas cacheadas da carreira;
+        # se a carreira esta coberta pelo vocabulario, reaproveita o vetor de
+        # niveis cacheado (gratuito logo apos um recomendar do mesmo perfil)
+        cols = [self._req_vocab.get(n) for n in carreira._req_names_lower]
+        if all(c is not None for c in cols):
+            U, _ = self._vetor_niveis(perfil)
+            U_aligned = U[np.asarray(cols, dtype=int)]
+        else:
+            U_aligned = np.array([
+                float(perfil._niveis[perfil._index[n]]) if n in perfil._index else 0.0
+                for n in carreira._req_names_lower
+            ])
+        gap = np.maximum(0.0, carreira._desejados - U_aligned)
+
+        # apenas os top_k maiores gaps, sem ordenar todos os requisitos
+        top_k = min(top_k, gap.size)
+        if top_k > 0:
+            idx = np.argpartition(-gap, top_k - 1)[:top_k]
+            idx = idx[np.argsort(-gap[idx], kind="stable")]
+        else:
+            idx = np.empty(0, dtype=int)
+
+        # transforma em recomendações práticas (strings), so para os escolhidos
         recomenda = []
-        for nome, gap, nivel_alvo in gaps[:top_k]:
-            recomenda.append(f"Aprender/Praticar '{nome}' até nivel {nivel_alvo:.1f} (gap {gap:.1f})")
+        for i in idx:
+            if gap[i] <= 0:
+                break
+            nome = carreira._req_names[i]
+            recomenda.append(
+                f"Aprender/Praticar '{nome}' até nivel {carreira._desejados[i]:.1f} (gap {gap[i]:.1f})"
+            )
         if not recomenda:
             recomenda.append("Perfil alinhado: consolidar conhecimentos e buscar especializacoes.")
         return recomenda
@@ -239,9 +570,17 @@ def carregar_carreiras_exemplo() -> List[Carreira]:
 
 # ===== CLI =====
 
+# cache de listagem: (mtime_ns do diretorio, lista de arquivos)
+_profiles_cache: Tuple[int, List[str]] = (-1, [])
+
+
 def listar_profiles() -> List[str]:
-    arquivos = [f for f in os.listdir(PROFILES_DIR) if f.endswith(".json")]
-    return arquivos
+    global _profiles_cache
+    mtime_ns = os.stat(PROFILES_DIR).st_mtime_ns
+    if mtime_ns != _profiles_cache[0]:
+        arquivos = [e.name for e in os.scandir(PROFILES_DIR) if e.name.endswith(".json")]
+        _profiles_cache = (mtime_ns, arquivos)
+    return _profiles_cache[1]
 
 
 def mostrar_profile(perfil: Perfil) -> None:
@@ -262,15 +601,21 @@ def mostrar_profile(perfil: Perfil) -> None:
 
 
 def entrada_float(prompt: str, minv: float = 0.0, maxv: float = 10.0) -> float:
+    err_msg = f"Valor deve estar entre {minv} e {maxv}"
     while True:
+        s = input(prompt).strip()
+        if not s:
+            # evita pagar a excecao de float('') em entradas vazias
+            continue
         try:
-            v = float(input(prompt))
-            if v < minv or v > maxv:
-                print(f"Valor deve estar entre {minv} e {maxv}")
-                continue
-            return v
+            v = float(s)
         except ValueError:
             print("Entrada invalida. Tente novamente.")
+            continue
+        if v < minv or v > maxv:
+            print(err_msg)
+            continue
+        return v
 
 
 def menu_principal():